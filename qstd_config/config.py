@@ -1,15 +1,12 @@
 import copy
 import typing
 
-import yaml
-
-from multiprocessing import Manager, current_process
-
 from .types import ProjectMetadata
 from .proxy import ProxyConfig, ProxyConfigDictContener
 from .utils import (
     abs_path,
-    cross_merge_dicts,
+    load_yaml_file,
+    cross_merge_into,
     unify_name,
     get_override_config_paths_from_env,
     get_override_config_paths_from_args
@@ -17,6 +14,10 @@ from .utils import (
 from .env import assign_env_to_dict, create_env_list_from_schema
 
 
+if typing.TYPE_CHECKING:
+    from multiprocessing.managers import SyncManager
+
+
 T = typing.TypeVar('T')
 
 
@@ -33,7 +34,7 @@ class ConfigManager(typing.Generic[T]):
         parse_config_paths_from_args: bool = True,
         parse_config_paths_from_env: bool = True,
         multiprocessing_mode: bool = False,
-        multiprocessing_manager: typing.Optional[Manager] = None
+        multiprocessing_manager: typing.Optional['SyncManager'] = None
     ):
         self.config_cls = config_cls
         self.config_paths = config_paths or []
@@ -48,14 +49,15 @@ class ConfigManager(typing.Generic[T]):
         self.multiprocessing_mode = multiprocessing_mode
         self._config_dict = ProxyConfigDictContener(None)
         if multiprocessing_mode:
+            from multiprocessing import Manager, current_process
             if current_process().name == 'MainProcess':
                 if multiprocessing_manager is None:
                     multiprocessing_manager = Manager()
                 self._config_dict.config_dict = multiprocessing_manager.dict()
             else:
-                self._config_dict.config_dict = dict()
+                self._config_dict.config_dict = {}
         else:
-            self._config_dict.config_dict = dict()
+            self._config_dict.config_dict = {}
         self.env_list = create_env_list_from_schema(config_cls, unify_name(self.project_metadata['name']))
         self.used_env = []
 
@@ -67,6 +69,7 @@ class ConfigManager(typing.Generic[T]):
     def get_multiprocessing_config_dict(self):
         if self.multiprocessing_mode is False:
             raise Exception('Multiprocessing mode disabled')
+        from multiprocessing import current_process
         if current_process().name != 'MainProcess':
             raise Exception('Get multiprocessing config allowed only on MainProcess')
         return self._config_dict.config_dict
@@ -75,15 +78,13 @@ class ConfigManager(typing.Generic[T]):
         return ProxyConfig(self._config_dict)
 
     def load_config(self) -> typing.Union[ProxyConfig, T]:
-        config_dict = dict()
+        config_dict = {}
 
         if self.project_metadata_as:
             config_dict[self.project_metadata_as] = copy.deepcopy(self.project_metadata)
 
         for config_path in self.config_paths:
-            with open(abs_path(config_path, self.root_config_dir), 'r') as file:
-                override_config_dict = yaml.safe_load(file) or dict()
-                config_dict = cross_merge_dicts(config_dict, override_config_dict)
+            cross_merge_into(config_dict, load_yaml_file(abs_path(config_path, self.root_config_dir)))
 
         self.used_env = assign_env_to_dict(config_dict, self.env_list)
 
@@ -91,6 +92,9 @@ class ConfigManager(typing.Generic[T]):
 
         config_dict = self.config_cls.parse_obj(config_dict).dict()
 
-        self._config_dict.config_dict.clear()
-        self._config_dict.config_dict.update(**config_dict)
+        storage_dict = self._config_dict.config_dict
+        stale_keys = [key for key in storage_dict.keys() if key not in config_dict]
+        storage_dict.update(config_dict)
+        for key in stale_keys:
+            del storage_dict[key]
         return typing.cast(T, ProxyConfig(self._config_dict))
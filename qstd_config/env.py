@@ -1,7 +1,7 @@
 import copy
 import os
 import typing
-from dataclasses import dataclass
+import weakref
 
 import jsonref
 from pydantic import BaseModel
@@ -9,58 +9,75 @@ from pydantic import BaseModel
 from .utils import unify_name
 
 
-@dataclass(frozen=True)
-class EnvOption:
-    parts: typing.List[str]
+class EnvOption(typing.NamedTuple):
+    parts: typing.Tuple[str, ...]
     type: str
     name: str
 
 
-def _fill_env_list(schema: dict, result: typing.List[EnvOption], parts: typing.List[str], project_name: str) -> None:
-    if 'allOf' in schema or 'anyOf' in schema:
-        for next_schema in schema.get('allOf') or schema.get('anyOf'):
-            _fill_env_list(next_schema, result, parts, project_name)
-    elif schema['type'] == 'object' or 'object' in schema['type']:
-        if 'properties' in schema:
-            for name, next_schema in schema['properties'].items():
-                current_parts = list(parts)
-                current_parts.append(name)
-                _fill_env_list(next_schema, result, current_parts, project_name)
-    else:
-        current_paths = list(parts)
-        name_parts = [unify_name(env_name) for env_name in current_paths]
-        name_parts.insert(0, project_name)
-        result.append(EnvOption(current_paths, schema['type'], '_'.join(name_parts)))
+_scalar_schema_types = frozenset(['string', 'integer', 'number', 'boolean'])
 
 
-def create_env_list_from_schema(config_cls: typing.Type[BaseModel], project_name: str) -> typing.List[EnvOption]:
+def _create_env_list(schema: dict, project_name: str) -> typing.List[EnvOption]:
     result: typing.List[EnvOption] = []
-    _fill_env_list(
-        copy.deepcopy(jsonref.loads(config_cls.schema_json(), jsonschema=True)),
-        result,
-        [],
-        project_name
-    )
+    stack: typing.List[typing.Tuple[dict, typing.Tuple[str, ...], str]] = [(schema, (), project_name)]
+    while stack:
+        node, parts, env_name = stack.pop()
+        schema_type = node.get('type')
+        if isinstance(schema_type, str) and schema_type in _scalar_schema_types:
+            result.append(EnvOption(parts, schema_type, env_name))
+            continue
+        sub_schemas = node.get('allOf') or node.get('anyOf')
+        if sub_schemas is not None:
+            stack.extend((next_schema, parts, env_name) for next_schema in reversed(sub_schemas))
+            continue
+        if schema_type is None:
+            raise KeyError('type')
+        if schema_type == 'object' or 'object' in schema_type:
+            properties = node.get('properties')
+            if properties is not None:
+                stack.extend(reversed([
+                    (next_schema, parts + (name,), f'{env_name}_{unify_name(name)}')
+                    for name, next_schema in properties.items()
+                ]))
+        else:
+            result.append(EnvOption(parts, schema_type, env_name))
     return result
 
 
+_EnvListCache = typing.Dict[str, typing.Tuple[EnvOption, ...]]
+_env_list_cache: 'weakref.WeakKeyDictionary[type, _EnvListCache]' = weakref.WeakKeyDictionary()
+
+
+def create_env_list_from_schema(config_cls: typing.Type[BaseModel], project_name: str) -> typing.List[EnvOption]:
+    env_lists = _env_list_cache.setdefault(config_cls, {})
+    env_list = env_lists.get(project_name)
+    if env_list is None:
+        env_list = env_lists[project_name] = tuple(_create_env_list(
+            copy.deepcopy(jsonref.loads(config_cls.schema_json(), jsonschema=True)),
+            project_name
+        ))
+    return list(env_list)
+
+
 def assign_env_to_dict(
     config: dict,
     env_list: typing.List[EnvOption],
 ) -> typing.List[str]:
     assigned_env_list: typing.List[str] = []
+    present_env_names = {env.name for env in env_list}.intersection(os.environ)
+    if not present_env_names:
+        return assigned_env_list
     for env in env_list:
-        value = os.environ.get(env.name, None)
-        if value is None:
+        if env.name not in present_env_names:
             continue
+        value = os.environ[env.name]
         assigned_env_list.append(env.name)
         current_config_dict = config
-        last_part_index = len(env.parts) - 1
-        for index, key in enumerate(env.parts):
-            if index == last_part_index:
-                current_config_dict[key] = value
-            else:
-                if key not in current_config_dict:
-                    current_config_dict[key] = dict()
-                current_config_dict = current_config_dict[key]
+        for key in env.parts[:-1]:
+            next_config_dict = current_config_dict.get(key)
+            if next_config_dict is None:
+                next_config_dict = current_config_dict[key] = {}
+            current_config_dict = next_config_dict
+        current_config_dict[env.parts[-1]] = value
     return assigned_env_list
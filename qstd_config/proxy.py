@@ -1,4 +1,5 @@
 import copy
+import typing
 
 exclude_proxy_fields = frozenset(['_state', '_config_dict', 'dict'])
 
@@ -9,6 +10,8 @@ class ProxyConfigDictContener:
 
 
 class ProxyConfig:
+    __slots__ = ('_state', '_config_dict')
+
     def __init__(self, config_dict: ProxyConfigDictContener, value=None):
         self._state = value
         self._config_dict = config_dict
@@ -24,17 +27,34 @@ class ProxyConfig:
     def __getattribute__(self, item):
         if item in exclude_proxy_fields:
             return object.__getattribute__(self, item)
-        if self._state is None:
-            value = self._config_dict.config_dict.get(item)
-        else:
-            value = self._state.get(item)
-        if isinstance(value, dict):
-            return ProxyConfig(self._config_dict, value)
-        if isinstance(value, list):
-            return [ProxyConfig(self._config_dict, val) if isinstance(val, dict) else val for val in value]
-        return value
+        state = object.__getattribute__(self, '_state')
+        if state is None:
+            state = object.__getattribute__(self, '_config_dict').config_dict
+        value = state.get(item)
+        wrap = _value_wrappers.get(type(value))
+        if wrap is None:
+            return value
+        return wrap(object.__getattribute__(self, '_config_dict'), value)
 
     def dict(self):
         if self._state:
             return copy.deepcopy(self._state)
         return copy.deepcopy(self._config_dict.config_dict)
+
+
+def _wrap_dict(config_dict: ProxyConfigDictContener, value: dict) -> ProxyConfig:
+    return ProxyConfig(config_dict, value)
+
+
+def _wrap_sequence(
+    config_dict: ProxyConfigDictContener,
+    value: typing.Union[list, tuple]
+) -> typing.Union[list, tuple]:
+    return type(value)(ProxyConfig(config_dict, val) if isinstance(val, dict) else val for val in value)
+
+
+_value_wrappers = {
+    dict: _wrap_dict,
+    list: _wrap_sequence,
+    tuple: _wrap_sequence
+}
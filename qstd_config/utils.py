@@ -1,53 +1,126 @@
 import copy
+import functools
 import os
-import re
 
 import typing
 
 
+class _UnifyNameTable(dict):
+    def __missing__(self, code: int) -> int:
+        return ord('_')
+
+
+_unify_name_table = _UnifyNameTable(
+    (code, code if chr(code).isalnum() else ord('_'))
+    for code in range(128)
+)
+
+
+@functools.lru_cache(maxsize=None)
 def unify_name(name: str):
-    return re.sub(pattern='[^a-zA-Z0-9]', repl='_', flags=re.DOTALL, string=name.upper())
+    return name.upper().translate(_unify_name_table)
 
 
 def abs_path(path: str, base_path: typing.Optional[str]):
-    if base_path is not None and not path.startswith('/'):
+    if base_path is not None and not os.path.isabs(path):
         return os.path.abspath(os.path.join(base_path, path))
     return path
 
 
+_immutable_config_value_types = frozenset([str, int, float, bool, bytes, type(None)])
+
+
+def _copy_config_value(value, ancestors: typing.Optional[dict] = None):
+    value_type = type(value)
+    if value_type in _immutable_config_value_types:
+        return value
+    if value_type is not dict and value_type is not list:
+        return copy.deepcopy(value)
+    if ancestors is None:
+        ancestors = {}
+    copied = ancestors.get(id(value))
+    if copied is not None:
+        return copied
+    if value_type is dict:
+        copied = ancestors[id(value)] = {}
+        for key, item in value.items():
+            copied[key] = _copy_config_value(item, ancestors)
+    else:
+        copied = ancestors[id(value)] = []
+        copied.extend(_copy_config_value(item, ancestors) for item in value)
+    del ancestors[id(value)]
+    return copied
+
+
+_yaml_file_cache: typing.Dict[str, typing.Tuple[bytes, dict]] = {}
+
+
+def load_yaml_file(path: str) -> dict:
+    with open(path, 'rb') as file:
+        content = file.read()
+    cached = _yaml_file_cache.get(path)
+    if cached is not None and cached[0] == content:
+        return _copy_config_value(cached[1])
+    import yaml
+    config = yaml.load(content, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)) or {}
+    if not isinstance(config, dict):
+        raise Exception(f'Config file {path} must contain a mapping at the top level')
+    _yaml_file_cache[path] = (content, config)
+    return _copy_config_value(config)
+
+
 def cross_merge_dicts(dict_a: dict, dict_b: dict):
-    result = copy.deepcopy(dict_a)
-    for key, value in dict_b.items():
-        if key not in result:
-            result[key] = value
-        elif isinstance(value, dict) and isinstance(result[key], dict):
-            result[key] = cross_merge_dicts(result[key], value)
-        else:
-            result[key] = value
-    return result
+    return cross_merge_into(_copy_config_value(dict_a), dict_b)
+
+
+def cross_merge_into(target: dict, source: dict) -> dict:
+    stack = [(target, source)]
+    merged_pairs = set()
+    while stack:
+        target_dict, source_dict = stack.pop()
+        if target_dict.keys().isdisjoint(source_dict.keys()):
+            target_dict.update(source_dict)
+            continue
+        for key, value in source_dict.items():
+            target_value = target_dict.get(key)
+            if isinstance(value, dict) and isinstance(target_value, dict):
+                pair = (id(target_value), id(value))
+                if pair not in merged_pairs:
+                    merged_pairs.add(pair)
+                    stack.append((target_value, value))
+            else:
+                target_dict[key] = value
+    return target
+
+
+def _split_config_paths(paths: str, root_path: str) -> typing.List[str]:
+    if ';' not in paths:
+        return [abs_path(paths, root_path)]
+    return [abs_path(path, root_path) for path in paths.split(';')]
 
 
 def get_override_config_paths_from_env(project_name: str, root_path: str) -> typing.List[str]:
-    paths = []
     env_paths = os.environ.get(f'{unify_name(project_name)}_CONFIG')
-    if env_paths:
-        for env_path in env_paths.split(';'):
-            paths.append(abs_path(env_path, root_path))
-    return paths
+    if not env_paths:
+        return []
+    return _split_config_paths(env_paths, root_path)
 
 
-def get_override_config_paths_from_args(root_path: str) -> typing.List[str]:
+@functools.lru_cache(maxsize=None)
+def _get_config_argument_parser():
     import argparse
-    paths = []
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument(
         '--config',
         '-c',
         type=str,
         help='The path to the application configuration file'
     )
-    argument_paths = parser.parse_known_args()[0].config
-    if argument_paths:
-        for argument_path in argument_paths.split(';'):
-            paths.append(abs_path(argument_path, root_path))
-    return paths
+    return parser
+
+
+def get_override_config_paths_from_args(root_path: str) -> typing.List[str]:
+    argument_paths = _get_config_argument_parser().parse_known_args()[0].config
+    if not argument_paths:
+        return []
+    return _split_config_paths(argument_paths, root_path)
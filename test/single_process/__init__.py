@@ -5,15 +5,20 @@ python3 ./test/single_process/__init__.py --config='config3.yaml;config4.yaml'
 """
 
 import os
+import typing
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Extra
 
 from qstd_config import ConfigManager, BaseConfig
+from qstd_config.proxy import ProxyConfig
+from qstd_config.utils import cross_merge_dicts
 
 
 CONFIG4_V1 = """
 test:
   test_field4: 'test_field4'
+db:
+  host: 'b'
 """
 
 CONFIG4_V2 = """
@@ -22,17 +27,45 @@ test:
   test_field2: 'test_field4'
   test_field3: 'test_field4'
   test_field4: 'test_field4'
+extra_field: 'extra_field'
+"""
+
+CONFIG4_V3 = """
+test:
+  test_field: 'test_field5'
+  test_field2: 'test_field4'
+  test_field3: 'test_field4'
+  test_field4: 'test_field4'
+extra_field: 'extra_field'
+"""
+
+CONFIG4_EMPTY_TEST = """
+test:
 """
 
 
 class Config(BaseConfig):
+    class Config:
+        extra = Extra.allow
+
     class Test(BaseModel):
         test_field: str
         test_field2: str
         test_field3: str
         test_field4: str
 
+    class Item(BaseModel):
+        name: str
+
+    class Db(BaseModel):
+        host: str
+        port: int
+
     test: Test
+    defaults: Db
+    db: Db
+    list_items: typing.List[Item] = [Item(name='list_item')]
+    tuple_items: typing.Tuple[Item, ...] = (Item(name='tuple_item'),)
 
 
 manager = ConfigManager(
@@ -64,6 +97,15 @@ assert config.test.test_field == 'test_field'
 assert config.test.test_field2 == 'test_field2'
 assert config.test.test_field3 == 'test_field3'
 assert config.test.test_field4 == 'test_field4'
+assert config.defaults.host == 'a'
+assert config.db.host == 'b'
+assert config.db.port == 1
+assert isinstance(config.list_items, list)
+assert isinstance(config.list_items[0], ProxyConfig)
+assert config.list_items[0].name == 'list_item'
+assert isinstance(config.tuple_items, tuple)
+assert isinstance(config.tuple_items[0], ProxyConfig)
+assert config.tuple_items[0].name == 'tuple_item'
 
 
 with open(os.path.join(manager.root_config_dir, 'config4.yaml'), 'w') as file:
@@ -75,6 +117,64 @@ assert config.test.test_field == 'test_field4'
 assert config.test.test_field2 == 'test_field4'
 assert config.test.test_field3 == 'test_field4'
 assert config.test.test_field4 == 'test_field4'
+assert config.extra_field == 'extra_field'
+
+os.environ['TEST_CONFIG_TEST_TEST_FIELD2'] = 'test_field_env'
+
+manager.load_config()
+
+assert config.test.test_field == 'test_field4'
+assert config.test.test_field2 == 'test_field_env'
+assert manager.used_env == ['TEST_CONFIG_TEST_TEST_FIELD2']
+
+del os.environ['TEST_CONFIG_TEST_TEST_FIELD2']
+
+config4_path = os.path.join(manager.root_config_dir, 'config4.yaml')
+config4_stat = os.stat(config4_path)
+
+with open(config4_path, 'w') as file:
+    file.write(CONFIG4_V3)
+
+os.utime(config4_path, ns=(config4_stat.st_atime_ns, config4_stat.st_mtime_ns))
+
+manager.load_config()
+
+assert os.stat(config4_path).st_size == config4_stat.st_size
+assert config.test.test_field == 'test_field5'
+
+with open(config4_path, 'w') as file:
+    file.write(CONFIG4_EMPTY_TEST)
+
+test_env_names = [
+    'TEST_CONFIG_TEST_TEST_FIELD',
+    'TEST_CONFIG_TEST_TEST_FIELD2',
+    'TEST_CONFIG_TEST_TEST_FIELD3',
+    'TEST_CONFIG_TEST_TEST_FIELD4'
+]
+
+for env_name in test_env_names:
+    os.environ[env_name] = env_name.lower()
+
+manager.load_config()
+
+assert config.test.test_field == 'test_config_test_test_field'
+assert config.test.test_field4 == 'test_config_test_test_field4'
+assert manager.used_env == test_env_names
+
+for env_name in test_env_names:
+    del os.environ[env_name]
 
 with open(os.path.join(manager.root_config_dir, 'config4.yaml'), 'w') as file:
     file.write(CONFIG4_V1)
+
+manager.load_config()
+
+assert config.test.test_field == 'test_field'
+assert 'extra_field' not in config.dict()
+assert config.extra_field is None
+
+shared_section = {'host': 'a'}
+merged = cross_merge_dicts({'x': shared_section, 'y': shared_section}, {'y': {'host': 'b'}})
+
+assert merged == {'x': {'host': 'a'}, 'y': {'host': 'b'}}
+assert shared_section == {'host': 'a'}